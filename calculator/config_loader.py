@@ -5,8 +5,19 @@ Config Loader - โหลดและจัดการ config files
 import json
 from pathlib import Path
 from decimal import Decimal
+from types import ModuleType
 from typing import Any
 
+from constants import WEAPON_SET_BONUSES
+
+# optional: parser ที่เร็วกว่า stdlib json
+orjson: ModuleType | None
+try:
+    import orjson as _orjson
+    orjson = _orjson
+except ImportError:
+    orjson = None
+
 
 def list_characters() -> list[str]:
     """แสดงรายชื่อตัวละครที่มี config"""
@@ -16,14 +27,25 @@ def list_characters() -> list[str]:
     return [f.stem for f in chars_dir.glob("*.json")]
 
 
+# ไฟล์ที่เล็กกว่านี้ใช้ stdlib json เสมอ: parser ภายนอกมี overhead ต่อครั้ง
+# ที่ไม่คุ้มกับไฟล์ขนาดเล็ก (config ตัวละคร/มอนสเตอร์ทั่วไปมีขนาดไม่กี่ KB)
+_ORJSON_MIN_BYTES = 8192
+
+
+def _read_json(path: Path) -> Any:
+    """อ่านไฟล์ JSON (ใช้ orjson กับไฟล์ขนาดใหญ่ถ้าติดตั้งไว้ ไม่งั้นใช้ stdlib json)"""
+    if orjson is not None and path.stat().st_size >= _ORJSON_MIN_BYTES:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
 def load_json(path: Path) -> dict[str, Any]:
     """โหลด JSON และกรองค่า comment/metadata ออก"""
     if path.exists():
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            return {
-                k: v for k, v in data.items() if not k.startswith("//") and not k.startswith("_")
-            }
+        data = _read_json(path)
+        return {
+            k: v for k, v in data.items() if not k.startswith("//") and not k.startswith("_")
+        }
     return {}
 
 
@@ -31,16 +53,20 @@ def load_character_full(name: str) -> tuple[dict[str, Any], dict[str, Any]]:
     """โหลด config จาก characters/[name].json รวม metadata"""
     char_path = Path(__file__).parent / "characters" / f"{name}.json"
     if char_path.exists():
-        with open(char_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            # แยก metadata และ config
-            meta = {k: v for k, v in data.items() if k.startswith("_")}
-            config = {k: v for k, v in data.items() 
-                      if not k.startswith("//") and not k.startswith("_")}
-            return meta, config
+        data = _read_json(char_path)
+        # แยก metadata และ config
+        meta = {k: v for k, v in data.items() if k.startswith("_")}
+        config = {k: v for k, v in data.items() 
+                  if not k.startswith("//") and not k.startswith("_")}
+        return meta, config
     return {}, {}
 
 
+def load_all_characters() -> dict[str, tuple[dict[str, Any], dict[str, Any]]]:
+    """โหลดตัวละครทุกตัวในครั้งเดียว -> {name: (meta, config)}"""
+    return {name: load_character_full(name) for name in list_characters()}
+
+
 def load_user_config() -> dict[str, Any]:
     """โหลด config จาก config.json"""
     config_path = Path(__file__).parent / "config.json"
@@ -53,8 +79,7 @@ def load_monster_preset(filename: str) -> dict[str, Any]:
     monster_path = monster_dir / filename
     
     if monster_path.exists():
-        with open(monster_path, "r", encoding="utf-8") as f:
-            preset = json.load(f)
+        preset = _read_json(monster_path)
         # กรองเฉพาะค่าที่ไม่ใช่ null และไม่ขึ้นต้นด้วย _
         return {k: v for k, v in preset.items() if v is not None and not k.startswith("_")}
     return {}
@@ -65,23 +90,29 @@ def apply_weapon_set(config: dict[str, Any]) -> dict[str, Any]:
     ใช้ชุดเซ็ทอาวุธตาม Weapon_Set
     0 = ไม่ใส่, 1 = จุดอ่อน(+35 WEAK), 2 = คริ(+15 IgnoreDEF), 
     3 = ไฮดร้า(+70 DMG_AMP), 4 = ตีปราสาท(+30 DMG_AMP)
+    คืนค่าเป็น dict ใหม่ ไม่แก้ไข config ที่ส่งเข้ามา
     """
-    weapon_set = int(config.get("Weapon_Set", 0))
+    applied = config.copy()
+    bonus = WEAPON_SET_BONUSES.get(int(config.get("Weapon_Set", 0)))
     
-    if weapon_set == 1:
-        # จุดอ่อน: +35% WEAK_DMG
-        config["WEAK_DMG"] = float(config.get("WEAK_DMG", 0)) + 35.0
-    elif weapon_set == 2:
-        # คริ: +15% Ignore_DEF
-        config["Ignore_DEF"] = float(config.get("Ignore_DEF", 0)) + 15.0
-    elif weapon_set == 3:
-        # ไฮดร้า: +70% DMG_AMP_BUFF
-        config["DMG_AMP_BUFF"] = float(config.get("DMG_AMP_BUFF", 0)) + 70.0
-    elif weapon_set == 4:
-        # ตีปราสาท: +30% DMG_AMP_BUFF
-        config["DMG_AMP_BUFF"] = float(config.get("DMG_AMP_BUFF", 0)) + 30.0
+    if bonus is not None:
+        key, value = bonus
+        applied[key] = float(config.get(key, 0)) + value
     
-    return config
+    return applied
+
+
+# ค่าที่ต้อง ADD กัน (ทั้งสองฝ่ายอาจมีค่า)
+ADDITIVE_KEYS: frozenset[str] = frozenset({
+    "SKILL_DMG", "CRIT_DMG", "WEAK_DMG", "DMG_AMP_BUFF", "DMG_AMP_DEBUFF",
+    "DEF_REDUCE", "BUFF_ATK", "DMG_Reduction", "Ignore_DEF",
+    "Bonus_DMG_HP_Target", "Cap_ATK_Percent",
+})
+
+# ค่าที่ต้อง mapping ไปใส่ key อื่น (เช่น Bonus_Crit_DMG -> CRIT_DMG)
+MAPPING_KEYS: dict[str, str] = {
+    "Bonus_Crit_DMG": "CRIT_DMG",
+}
 
 
 def merge_configs(char_config: dict[str, Any], user_config: dict[str, Any]) -> dict[str, Any]:
@@ -92,26 +123,14 @@ def merge_configs(char_config: dict[str, Any], user_config: dict[str, Any]) -> d
     """
     merged = user_config.copy()
     
-    # ค่าที่ต้อง ADD กัน (ทั้งสองฝ่ายอาจมีค่า)
-    additive_keys = [
-        "SKILL_DMG", "CRIT_DMG", "WEAK_DMG", "DMG_AMP_BUFF", "DMG_AMP_DEBUFF", 
-        "DEF_REDUCE", "BUFF_ATK", "DMG_Reduction", "Ignore_DEF",
-        "Bonus_DMG_HP_Target", "Cap_ATK_Percent"
-    ]
-    
-    # ค่าที่ต้อง mapping ไปใส่ key อื่น (เช่น Bonus_Crit_DMG -> CRIT_DMG)
-    mapping_keys: dict[str, str] = {
-        "Bonus_Crit_DMG": "CRIT_DMG"
-    }
-    
     for key, value in char_config.items():
-        if key in additive_keys:
+        if key in ADDITIVE_KEYS:
             # ADD ค่าเข้าด้วยกัน
             user_value = user_config.get(key, 0)
             merged[key] = float(value) + float(user_value)
-        elif key in mapping_keys:
+        elif key in MAPPING_KEYS:
             # Mapping key: ADD ไปใส่ key ปลายทาง
-            target_key = mapping_keys[key]
+            target_key = MAPPING_KEYS[key]
             current_value = merged.get(target_key, 0)
             merged[target_key] = float(current_value) + float(value)
         elif key not in merged:
@@ -8,6 +8,15 @@ from decimal import Decimal
 # DEF Modifier - ตัวคูณ DEF ในระบบ (ยืนยันจากการทดสอบ)
 DEF_MODIFIER = Decimal("0.00214135")
 
+# โบนัสชุดเซ็ทอาวุธตาม Weapon_Set -> (key ที่ได้โบนัส, ค่าที่บวกเพิ่ม %)
+# 0 = ไม่ใส่ (ไม่มีโบนัส)
+WEAPON_SET_BONUSES: dict[int, tuple[str, float]] = {
+    1: ("WEAK_DMG", 35.0),       # จุดอ่อน
+    2: ("Ignore_DEF", 15.0),     # คริ
+    3: ("DMG_AMP_BUFF", 70.0),   # ไฮดร้า
+    4: ("DMG_AMP_BUFF", 30.0),   # ตีปราสาท
+}
+
 # ATK_BASE ตามสายและ Rarity (6 ดาว+5)
 # สาย: attack, magic, support, defense, balance
 
@@ -3,18 +3,37 @@
 สูตรการคำนวณดาเมจตาม AGENTS.md (แก้ไขแล้ว)
 """
 
+from collections.abc import Sequence
 from decimal import Decimal, ROUND_DOWN
+from functools import lru_cache
 from constants import DEF_MODIFIER, ATK_BASE
 
 # Type alias for values that can be converted to Decimal
 NumericType = int | float | str | Decimal
 
+# ค่าคงที่ที่ใช้ซ้ำทุกการคำนวณ (สร้างครั้งเดียวตอน import แทนการ parse string ทุกครั้ง)
+_ZERO = Decimal("0")
+_ONE = Decimal("1")
+_HUNDRED = Decimal("100")
+# ตัวหารรวมของค่า % ที่คูณกันหลายตัว (หารครั้งเดียวตอนท้ายแทนการหาร 100 ทีละตัว)
+_PERCENT_2 = Decimal("10000")          # 100^2
+# DEF_MODIFIER รวมตัวหาร 100^2 ของ (DEF_BUFF/REDUCE) และ Ignore_DEF ไว้แล้ว
+_DEF_COEFF = DEF_MODIFIER / _PERCENT_2
+
+
+@lru_cache(maxsize=4096)
+def _decimal_from_str(text: str) -> Decimal:
+    """parse string เป็น Decimal (cache ไว้เพราะค่าใน config ซ้ำกันบ่อย เช่น "0", "100")"""
+    return Decimal(text)
+
 
 def to_decimal(value: NumericType) -> Decimal:
     """แปลงค่าเป็น Decimal"""
     if isinstance(value, Decimal):
         return value
-    return Decimal(str(value))
+    if type(value) is int:
+        return Decimal(value)
+    return _decimal_from_str(value if isinstance(value, str) else str(value))
 
 
 def calculate_total_atk(
@@ -32,10 +51,10 @@ def calculate_total_atk(
     สูตร: (ATK_CHAR + ATK_PET + (ATK_BASE * (Formation + Potential_PET) / 100)) 
           * (1 + ((BUFF_ATK + BUFF_ATK_PET) / 100))
     """
-    formation_bonus = atk_base * (formation + potential_pet) / Decimal("100")
-    base_atk = atk_char + atk_pet + formation_bonus
-    buff_mult = Decimal("1") + (buff_atk + buff_atk_pet) / Decimal("100")
-    return base_atk * buff_mult
+    # คิดในหน่วย % ทั้งหมด แล้วหาร 100^2 ครั้งเดียว
+    base_atk_pct = (atk_char + atk_pet) * _HUNDRED + atk_base * (formation + potential_pet)
+    buff_pct = _HUNDRED + buff_atk + buff_atk_pet
+    return base_atk_pct * buff_pct / _PERCENT_2
 
 
 def calculate_dmg_hp(
@@ -47,7 +66,7 @@ def calculate_dmg_hp(
     
     สูตร: HP_Target * Bonus_DMG_HP_Target / 100
     """
-    return hp_target * bonus_dmg_hp_target / Decimal("100")
+    return hp_target * bonus_dmg_hp_target / _HUNDRED
 
 
 def calculate_cap_atk(
@@ -59,7 +78,7 @@ def calculate_cap_atk(
     
     สูตร: Total_ATK * Cap_ATK% / 100
     """
-    return total_atk * cap_atk_percent / Decimal("100")
+    return total_atk * cap_atk_percent / _HUNDRED
 
 
 def calculate_final_dmg_hp(
@@ -71,11 +90,11 @@ def calculate_final_dmg_hp(
     
     สูตร: ROUNDDOWN(IF(DMG_HP > Cap_ATK, Cap_ATK, DMG_HP))
     """
-    if dmg_hp > cap_atk and cap_atk > Decimal("0"):
+    if dmg_hp > cap_atk and cap_atk > _ZERO:
         result = cap_atk
     else:
         result = dmg_hp
-    return result.quantize(Decimal("1"), rounding=ROUND_DOWN)
+    return result.quantize(_ONE, rounding=ROUND_DOWN)
 
 
 def calculate_raw_dmg(
@@ -86,7 +105,7 @@ def calculate_raw_dmg(
     dmg_amp_buff: Decimal,
     dmg_amp_debuff: Decimal,
     dmg_reduction: Decimal,
-    final_dmg_hp: Decimal = Decimal("0")
+    final_dmg_hp: Decimal = _ZERO
 ) -> Decimal:
     """
     คำนวณ RAW Damage (ดาเมจดิบ)
@@ -99,22 +118,82 @@ def calculate_raw_dmg(
      * (1 + WEAK_DMG/100) * (1 + DMG_AMP_BUFF/100) 
      * (1 + (DMG_AMP_DEBUFF - DMG_Reduction)/100))
     """
+    # ไม่มีดาเมจทั้งส่วน ATK และ HP-based → ไม่ต้องคูณต่อ
+    if final_dmg_hp == _ZERO and (skill_dmg == _ZERO or crit_dmg == _ZERO):
+        return _ZERO
+
+    skill_mult = skill_dmg / _HUNDRED
+    crit_mult = crit_dmg / _HUNDRED
+
+    # ไม่มีตัวคูณจุดอ่อน/AMP/Reduction (กรณีที่พบบ่อย) → ตัวคูณที่เหลือเป็น 1 ทั้งหมด ข้ามได้
+    if not (weak_dmg or dmg_amp_buff or dmg_amp_debuff or dmg_reduction):
+        return total_atk * skill_mult * crit_mult + final_dmg_hp * crit_mult
+
     # ตัวคูณร่วม
-    skill_mult = skill_dmg / Decimal("100")
-    crit_mult = crit_dmg / Decimal("100")
-    weak_mult = Decimal("1") + weak_dmg / Decimal("100")
-    amp_buff_mult = Decimal("1") + dmg_amp_buff / Decimal("100")
-    amp_debuff_reduction_mult = Decimal("1") + (dmg_amp_debuff - dmg_reduction) / Decimal("100")
-    
-    # ส่วนแรก: ดาเมจจาก ATK
-    atk_dmg = total_atk * skill_mult * crit_mult * weak_mult * amp_buff_mult * amp_debuff_reduction_mult
-    
-    # ส่วนสอง: ดาเมจจาก HP-based
-    hp_dmg = final_dmg_hp * crit_mult * weak_mult * amp_buff_mult * amp_debuff_reduction_mult
-    
+    weak_mult = _ONE + weak_dmg / _HUNDRED
+    amp_buff_mult = _ONE + dmg_amp_buff / _HUNDRED
+    amp_debuff_reduction_mult = _ONE + (dmg_amp_debuff - dmg_reduction) / _HUNDRED
+
+    # ส่วนแรก: ดาเมจจาก ATK / ส่วนสอง: ดาเมจจาก HP-based
+    atk_dmg = _apply_dmg_multipliers(
+        total_atk * skill_mult, crit_mult, weak_mult, amp_buff_mult, amp_debuff_reduction_mult
+    )
+    hp_dmg = _apply_dmg_multipliers(
+        final_dmg_hp, crit_mult, weak_mult, amp_buff_mult, amp_debuff_reduction_mult
+    )
     return atk_dmg + hp_dmg
 
 
+def _apply_dmg_multipliers(
+    value: Decimal,
+    crit_mult: Decimal,
+    weak_mult: Decimal,
+    amp_buff_mult: Decimal,
+    amp_debuff_reduction_mult: Decimal
+) -> Decimal:
+    """
+    คูณตัวคูณร่วมของ RAW Damage (CRIT x WEAK x AMP_BUFF x (AMP_DEBUFF - Reduction))
+
+    คูณจากซ้ายไปขวาทีละตัวเสมอ เพราะลำดับการคูณมีผลกับการปัดเศษที่หลักที่ 28 ของ Decimal
+    """
+    return value * crit_mult * weak_mult * amp_buff_mult * amp_debuff_reduction_mult
+
+
+def calculate_raw_dmg_batch(
+    total_atk: Decimal,
+    skill_dmg: Decimal,
+    cases: Sequence[tuple[Decimal, Decimal]],
+    dmg_amp_buff: Decimal,
+    dmg_amp_debuff: Decimal,
+    dmg_reduction: Decimal,
+    final_dmg_hp: Decimal = _ZERO
+) -> list[Decimal]:
+    """
+    คำนวณ RAW Damage หลายกรณีในครั้งเดียว (เช่น คริ/ไม่คริ x จุดอ่อน/ไม่จุดอ่อน)
+
+    cases: ลำดับของ (CRIT_DMG, WEAK_DMG) แต่ละกรณี
+    ตัวคูณที่ไม่ขึ้นกับ CRIT_DMG/WEAK_DMG คำนวณครั้งเดียวแล้วใช้ร่วมกันทุกกรณี
+    ผลลัพธ์ตรงกับการเรียก calculate_raw_dmg() ทีละกรณี
+    """
+    skill_mult = skill_dmg / _HUNDRED
+    amp_buff_mult = _ONE + dmg_amp_buff / _HUNDRED
+    amp_debuff_reduction_mult = _ONE + (dmg_amp_debuff - dmg_reduction) / _HUNDRED
+    atk_skill = total_atk * skill_mult
+
+    results = []
+    for crit_dmg, weak_dmg in cases:
+        crit_mult = crit_dmg / _HUNDRED
+        weak_mult = _ONE + weak_dmg / _HUNDRED
+        atk_dmg = _apply_dmg_multipliers(
+            atk_skill, crit_mult, weak_mult, amp_buff_mult, amp_debuff_reduction_mult
+        )
+        hp_dmg = _apply_dmg_multipliers(
+            final_dmg_hp, crit_mult, weak_mult, amp_buff_mult, amp_debuff_reduction_mult
+        )
+        results.append(atk_dmg + hp_dmg)
+    return results
+
+
 def calculate_effective_def(
     def_target: Decimal,
     def_buff: Decimal,
@@ -126,10 +205,9 @@ def calculate_effective_def(
     
     สูตร: 1 + (DEF_Modifier * DEF_Target * ((1 + DEF_BUFF/100 - DEF_REDUCE/100) * (1 - Ignore_DEF/100)))
     """
-    def_mult = Decimal("1") + def_buff / Decimal("100") - def_reduce / Decimal("100")
-    ignore_mult = Decimal("1") - ignore_def / Decimal("100")
-    effective = Decimal("1") + (DEF_MODIFIER * def_target * def_mult * ignore_mult)
-    return effective
+    def_pct = _HUNDRED + def_buff - def_reduce
+    ignore_pct = _HUNDRED - ignore_def
+    return _ONE + (_DEF_COEFF * def_target * def_pct * ignore_pct)
 
 
 def calculate_final_dmg(
@@ -141,5 +219,19 @@ def calculate_final_dmg(
     
     สูตร: ROUNDDOWN(RAW_DMG / Effective_DEF)
     """
-    final = raw_dmg / effective_def
-    return int(final.quantize(Decimal("1"), rounding=ROUND_DOWN))
+    # int() ตัดเศษทิ้ง (ปัดเข้าหาศูนย์) ได้ผลเท่ากับ ROUND_DOWN
+    return int(raw_dmg / effective_def)
+
+
+def calculate_final_dmg_batch(
+    raw_dmgs: Sequence[Decimal],
+    effective_def: Decimal
+) -> list[int]:
+    """
+    คำนวณ Final Damage หลายค่าที่ใช้ Effective DEF เดียวกันในครั้งเดียว
+
+    ผลลัพธ์ตรงกับการเรียก calculate_final_dmg() ทีละค่า
+    (ยังหารด้วย Effective_DEF ตรง ๆ เพราะการคูณด้วยส่วนกลับทำให้ผล ROUNDDOWN คลาดได้)
+    """
+    return [int(raw_dmg / effective_def) for raw_dmg in raw_dmgs]
+
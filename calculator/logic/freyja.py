@@ -6,7 +6,12 @@ HP Alteration = ปรับ HP เป้าหมายเหลือ X% (ไ
 from decimal import Decimal, ROUND_DOWN
 from typing import Any
 
-from damage_calc import calculate_total_atk, calculate_raw_dmg, calculate_effective_def
+from damage_calc import (
+    calculate_total_atk,
+    calculate_raw_dmg_batch,
+    calculate_final_dmg_batch,
+    calculate_effective_def,
+)
 
 
 def calculate_hp_alteration_damage(hp_target: Decimal, hp_alteration_percent: Decimal) -> int:
@@ -48,35 +53,21 @@ def calculate_freyja_damage(
     base_weakness = Decimal("30")
     total_weakness = base_weakness + weak_dmg
     
-    # === กรณี 1: ดาเมจคริปกติ (ไม่มี HP Alteration) ===
-    raw_crit = calculate_raw_dmg(
+    # === กรณี 1 และ 3: ดาเมจคริปกติ / ติดจุดอ่อน (ไม่มี HP Alteration) ===
+    raw_crit, raw_weak = calculate_raw_dmg_batch(
         total_atk=total_atk,
         skill_dmg=skill_dmg,
-        crit_dmg=crit_dmg,
-        weak_dmg=Decimal("0"),
+        cases=[(crit_dmg, Decimal("0")), (crit_dmg, total_weakness)],
         dmg_amp_buff=dmg_amp_buff,
         dmg_amp_debuff=dmg_amp_debuff,
         dmg_reduction=dmg_reduction,
         final_dmg_hp=Decimal("0")
     )
-    final_crit = int((raw_crit / eff_def).quantize(Decimal("1"), rounding=ROUND_DOWN))
+    final_crit, final_weak = calculate_final_dmg_batch([raw_crit, raw_weak], eff_def)
     
     # === กรณี 2: HP Alteration damage ===
     hp_alter_damage = calculate_hp_alteration_damage(hp_target, hp_alteration)
     
-    # === กรณี 3: ดาเมจติดจุดอ่อน (ไม่มี HP Alteration) ===
-    raw_weak = calculate_raw_dmg(
-        total_atk=total_atk,
-        skill_dmg=skill_dmg,
-        crit_dmg=crit_dmg,
-        weak_dmg=total_weakness,
-        dmg_amp_buff=dmg_amp_buff,
-        dmg_amp_debuff=dmg_amp_debuff,
-        dmg_reduction=dmg_reduction,
-        final_dmg_hp=Decimal("0")
-    )
-    final_weak = int((raw_weak / eff_def).quantize(Decimal("1"), rounding=ROUND_DOWN))
-    
     return {
         "crit_damage": final_crit,
         "crit_per_hit": final_crit // skill_hits if skill_hits > 0 else final_crit,
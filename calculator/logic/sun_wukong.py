@@ -6,13 +6,13 @@ Sun Wukong Special Logic - Castle Mode Calculator
 
 from __future__ import annotations
 
-from decimal import Decimal, ROUND_DOWN
+from decimal import Decimal
 from typing import Any
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from damage_calc import calculate_raw_dmg
+from damage_calc import calculate_raw_dmg_batch, calculate_final_dmg_batch
 
 
 def calculate_sun_wukong_castle_mode(
@@ -40,32 +40,26 @@ def calculate_sun_wukong_castle_mode(
     base_weakness = Decimal("30")
     total_weakness = base_weakness + weak_dmg
     
-    # === ดาเมจติดจุดอ่อน (ไม่ติดคริ) ===
-    # เมื่อไม่ติดคริ CRIT_DMG จะเป็น 100% (ตัวคูณ x1)
-    raw_weak_only = calculate_raw_dmg(
+    # คำนวณทั้ง 3 กรณีในครั้งเดียว (ต่างกันแค่ CRIT_DMG / WEAK_DMG)
+    # - ติดจุดอ่อน (ไม่ติดคริ): CRIT_DMG = 100% (x1)
+    # - ติดคริ + จุดอ่อน
+    # - ปกติ (ไม่คริ, ไม่จุดอ่อน): WEAK_DMG = 0 (และไม่บวก base 30%), CRIT_DMG = 100%
+    raw_weak_only, raw_crit_weak, raw_normal = calculate_raw_dmg_batch(
         total_atk=total_atk,
         skill_dmg=skill_dmg,
-        crit_dmg=Decimal("100"),  # ไม่ติดคริ = 100% (x1)
-        weak_dmg=total_weakness,
+        cases=[
+            (Decimal("100"), total_weakness),
+            (crit_dmg, total_weakness),
+            (Decimal("100"), Decimal("0")),
+        ],
         dmg_amp_buff=dmg_amp_buff,
         dmg_amp_debuff=dmg_amp_debuff,
         dmg_reduction=dmg_reduction,
         final_dmg_hp=final_dmg_hp
     )
-    dmg_weak_only_per_hit = int((raw_weak_only / eff_def).quantize(Decimal("1"), rounding=ROUND_DOWN))
-    
-    # === ดาเมจติดคริ + จุดอ่อน ===
-    raw_crit_weak = calculate_raw_dmg(
-        total_atk=total_atk,
-        skill_dmg=skill_dmg,
-        crit_dmg=crit_dmg,
-        weak_dmg=total_weakness,
-        dmg_amp_buff=dmg_amp_buff,
-        dmg_amp_debuff=dmg_amp_debuff,
-        dmg_reduction=dmg_reduction,
-        final_dmg_hp=final_dmg_hp
+    dmg_weak_only_per_hit, dmg_crit_weak_per_hit, dmg_normal_per_hit = calculate_final_dmg_batch(
+        [raw_weak_only, raw_crit_weak, raw_normal], eff_def
     )
-    dmg_crit_weak_per_hit = int((raw_crit_weak / eff_def).quantize(Decimal("1"), rounding=ROUND_DOWN))
     
     # === หาจำนวนคริขั้นต่ำที่ต้องการ ===
     # สูตร: c ครั้งติดคริ + (n-c) ครั้งติดแค่จุดอ่อน >= HP_Target
@@ -73,20 +67,6 @@ def calculate_sun_wukong_castle_mode(
     # c * (dmg_crit - dmg_weak) >= HP - n * dmg_weak
     # c >= (HP - n * dmg_weak) / (dmg_crit - dmg_weak)
     
-    # === ดาเมจปกติ (ไม่คริ, ไม่จุดอ่อน) ===
-    # WEAK_DMG = 0 (และไม่บวก base 30%), CRIT_DMG = 100%
-    raw_normal = calculate_raw_dmg(
-        total_atk=total_atk,
-        skill_dmg=skill_dmg,
-        crit_dmg=Decimal("100"),
-        weak_dmg=Decimal("0"),  # ไม่ติดจุดอ่อนเลย
-        dmg_amp_buff=dmg_amp_buff,
-        dmg_amp_debuff=dmg_amp_debuff,
-        dmg_reduction=dmg_reduction,
-        final_dmg_hp=final_dmg_hp
-    )
-    dmg_normal_per_hit = int((raw_normal / eff_def).quantize(Decimal("1"), rounding=ROUND_DOWN))
-    
     # === หาจำนวนคริขั้นต่ำที่ต้องการ (2 กรณี) ===
     hp = int(hp_target)
     n = skill_hits
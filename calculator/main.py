@@ -10,9 +10,9 @@ from damage_calc import (
     calculate_dmg_hp,
     calculate_cap_atk,
     calculate_final_dmg_hp,
-    calculate_raw_dmg,
+    calculate_raw_dmg_batch,
     calculate_effective_def,
-    calculate_final_dmg,
+    calculate_final_dmg_batch,
 )
 from constants import get_atk_base
 from config_loader import load_user_config, apply_weapon_set, merge_configs, get_decimal
@@ -125,29 +125,25 @@ def main():
     final_dmg_hp = calculate_final_dmg_hp(dmg_hp, cap_atk)
     print_hp_based_damage(dmg_hp, cap_atk, final_dmg_hp)
     
-    # 3. RAW Damage (แยกคำนวณ 4 แบบ)
+    # 3. RAW Damage (แยกคำนวณ 4 แบบ ในครั้งเดียว)
     # 3.1 RAW คริ (ไม่ติดจุดอ่อน, WEAK_DMG = 0)
-    raw_dmg_crit = calculate_raw_dmg(
-        total_atk, skill_dmg, crit_dmg, Decimal("0"),
-        dmg_amp_buff, dmg_amp_debuff, dmg_reduction, final_dmg_hp
-    )
-    
     # 3.2 RAW คริ+ติดจุดอ่อน (30% พื้นฐาน + WEAK_DMG จาก config)
-    total_weak_dmg = Decimal("30") + weak_dmg
-    raw_dmg_crit_weakness = calculate_raw_dmg(
-        total_atk, skill_dmg, crit_dmg, total_weak_dmg,
-        dmg_amp_buff, dmg_amp_debuff, dmg_reduction, final_dmg_hp
-    )
-    
     # 3.3 RAW ไม่คริ (CRIT_DMG = 100, WEAK_DMG = 0)
-    raw_dmg_no_crit = calculate_raw_dmg(
-        total_atk, skill_dmg, Decimal("100"), Decimal("0"),
-        dmg_amp_buff, dmg_amp_debuff, dmg_reduction, final_dmg_hp
-    )
-    
     # 3.4 RAW ติดจุดอ่อนอย่างเดียว (CRIT_DMG = 100, WEAK_DMG = 30 + config)
-    raw_dmg_weakness_only = calculate_raw_dmg(
-        total_atk, skill_dmg, Decimal("100"), total_weak_dmg,
+    total_weak_dmg = Decimal("30") + weak_dmg
+    (
+        raw_dmg_crit,
+        raw_dmg_crit_weakness,
+        raw_dmg_no_crit,
+        raw_dmg_weakness_only,
+    ) = calculate_raw_dmg_batch(
+        total_atk, skill_dmg,
+        [
+            (crit_dmg, Decimal("0")),
+            (crit_dmg, total_weak_dmg),
+            (Decimal("100"), Decimal("0")),
+            (Decimal("100"), total_weak_dmg),
+        ],
         dmg_amp_buff, dmg_amp_debuff, dmg_reduction, final_dmg_hp
     )
     
@@ -216,10 +212,15 @@ def main():
                 return  # Handler จัดการเรียบร้อยแล้ว
     
     # 5. Final Damage (ต่อ 1 hit) - สำหรับตัวละครปกติ
-    final_dmg_crit = calculate_final_dmg(raw_dmg_crit, effective_def)
-    final_dmg_crit_weakness = calculate_final_dmg(raw_dmg_crit_weakness, effective_def)
-    final_dmg_no_crit = calculate_final_dmg(raw_dmg_no_crit, effective_def)
-    final_dmg_weakness_only = calculate_final_dmg(raw_dmg_weakness_only, effective_def)
+    (
+        final_dmg_crit,
+        final_dmg_crit_weakness,
+        final_dmg_no_crit,
+        final_dmg_weakness_only,
+    ) = calculate_final_dmg_batch(
+        [raw_dmg_crit, raw_dmg_crit_weakness, raw_dmg_no_crit, raw_dmg_weakness_only],
+        effective_def,
+    )
     
     # ดึง HP มอนจาก monster_preset (ถ้ามี)
     monster_hp = monster_preset.get("HP_Target", 0) if monster_preset else 0
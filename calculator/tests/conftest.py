@@ -5,7 +5,12 @@ Pytest Configuration and Shared Fixtures
 import pytest
 import sys
 from pathlib import Path
+from collections.abc import Mapping
 from decimal import Decimal
+from types import MappingProxyType
+from typing import Any
+
+from config_loader import load_all_characters
 
 
 # ============================================================================
@@ -32,6 +37,13 @@ def pytest_configure(config):
 # Shared Fixtures
 # ============================================================================
 
+def _frozen(data: dict[Any, Any]) -> Mapping[Any, Any]:
+    """Read-only view of a (nested) dict so session fixtures can be shared safely"""
+    return MappingProxyType(
+        {k: _frozen(v) if isinstance(v, dict) else v for k, v in data.items()}
+    )
+
+
 @pytest.fixture(scope="session")
 def calculator_path():
     """Path to calculator directory"""
@@ -50,10 +62,19 @@ def characters_path(calculator_path):
     return calculator_path / "characters"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def character_data() -> Mapping[str, tuple[Mapping[str, Any], Mapping[str, Any]]]:
+    """All characters loaded once per session (read-only): name -> (meta, config)"""
+    return MappingProxyType({
+        name: (_frozen(meta), _frozen(config))
+        for name, (meta, config) in load_all_characters().items()
+    })
+
+
+@pytest.fixture(scope="session")
 def standard_atk_config():
     """Standard ATK configuration for testing"""
-    return {
+    return _frozen({
         "atk_char": Decimal("5000"),
         "atk_pet": Decimal("400"),
         "atk_base": Decimal("1500"),
@@ -61,13 +82,13 @@ def standard_atk_config():
         "potential_pet": Decimal("0"),
         "buff_atk": Decimal("0"),
         "buff_atk_pet": Decimal("0"),
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def standard_damage_config():
     """Standard damage configuration for testing"""
-    return {
+    return _frozen({
         "total_atk": Decimal("5400"),
         "skill_dmg": Decimal("160"),
         "crit_dmg": Decimal("288"),
@@ -75,49 +96,28 @@ def standard_damage_config():
         "dmg_amp_buff": Decimal("0"),
         "dmg_amp_debuff": Decimal("0"),
         "dmg_reduction": Decimal("10"),
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def standard_def_config():
     """Standard DEF configuration for testing"""
-    return {
+    return _frozen({
         "def_target": Decimal("1461"),
         "def_buff": Decimal("0"),
         "def_reduce": Decimal("0"),
         "ignore_def": Decimal("0"),
-    }
-
-
-# ============================================================================
-# Helper Functions
-# ============================================================================
-
-def approx_decimal(value: Decimal, tolerance: Decimal = Decimal("1")) -> bool:
-    """
-    Compare Decimal values with tolerance
-
-    Args:
-        value: First value
-        tolerance: Maximum difference allowed
-
-    Returns:
-        True if values are within tolerance
-    """
-    def approx(a: Decimal, b: Decimal, tol: Decimal = Decimal("1")) -> bool:
-        return abs(a - b) <= tol
-
-    return pytest.approx(float(value), abs=float(tolerance))
+    })
 
 
 # ============================================================================
 # Test Data
 # ============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def atk_base_values():
     """ATK_BASE values by class and rarity"""
-    return {
+    return _frozen({
         "legend": {
             "magic": Decimal("1500"),
             "attack": Decimal("1500"),
@@ -132,13 +132,13 @@ def atk_base_values():
             "defense": Decimal("704"),
             "balance": Decimal("1238"),
         },
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def castle_monster_data():
     """Castle monster preset data"""
-    return {
+    return _frozen({
         "room1": {
             "name": "Castle Room 1",
             "def": Decimal("689"),
@@ -149,16 +149,16 @@ def castle_monster_data():
             "def": Decimal("784"),
             "hp": Decimal("10790"),
         },
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def weapon_set_bonuses():
     """Weapon set bonuses"""
-    return {
+    return _frozen({
         0: {"name": "None", "weak_dmg": 0, "ignore_def": 0, "dmg_amp": 0},
         1: {"name": "Weakness", "weak_dmg": 35, "ignore_def": 0, "dmg_amp": 0},
         2: {"name": "Crit", "weak_dmg": 0, "ignore_def": 15, "dmg_amp": 0},
         3: {"name": "Hydra", "weak_dmg": 0, "ignore_def": 0, "dmg_amp": 70},
         4: {"name": "Hydra Castle", "weak_dmg": 0, "ignore_def": 0, "dmg_amp": 30},
-    }
+    })
@@ -0,0 +1,61 @@
+"""
+Shared Test Helpers (import from test modules: ``from tests.helpers import ...``)
+"""
+
+from collections.abc import Mapping
+from decimal import Decimal
+from typing import Any
+
+
+# Shared Decimal constants (Decimal is immutable, safe to reuse across tests)
+# HUNDRED is for percentage inputs (100%); write stats of 100 as Decimal("100")
+ZERO = Decimal("0")
+HUNDRED = Decimal("100")
+
+
+class _Approx:
+    """Lightweight tolerance comparison used by approx_decimal()"""
+
+    __slots__ = ("t", "v")
+
+    def __init__(self, value: float, tolerance: float) -> None:
+        self.v = value
+        self.t = tolerance
+
+    def __eq__(self, other: object) -> bool:
+        try:
+            return abs(float(other) - self.v) <= self.t  # type: ignore[arg-type]
+        except (TypeError, ValueError):
+            return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{self.v} ± {self.t}"
+
+
+def approx_decimal(value: Decimal, tolerance: Decimal = Decimal("1")) -> _Approx:
+    """
+    Compare Decimal values with tolerance
+
+    Usage: assert result == approx_decimal(expected)
+
+    Args:
+        value: Expected value
+        tolerance: Maximum difference allowed
+
+    Returns:
+        Object that compares equal to values within tolerance
+    """
+    return _Approx(float(value), float(tolerance))
+
+
+def coerce_decimal(config: Mapping[str, Any]) -> dict[str, Any]:
+    """
+    Convert float values in a config to Decimal in a single pass
+
+    Args:
+        config: Config dict (e.g. result of apply_weapon_set/merge_configs)
+
+    Returns:
+        New dict with float values replaced by Decimal(str(value))
+    """
+    return {k: (Decimal(str(v)) if isinstance(v, float) else v) for k, v in config.items()}
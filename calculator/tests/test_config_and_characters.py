@@ -6,17 +6,16 @@ Tests config loading, merging, weapon sets, and standard character calculations.
 
 import pytest
 import json
-from pathlib import Path
+from types import SimpleNamespace
 from decimal import Decimal
 from typing import Any
 
 # Import functions to test
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
+import config_loader
 from config_loader import (
     load_json,
     load_character_full,
+    load_all_characters,
     load_user_config,
     load_monster_preset,
     apply_weapon_set,
@@ -31,6 +30,8 @@ from damage_calc import (
     calculate_final_dmg,
 )
 from character_registry import get_character_handler, list_registered_characters
+from constants import WEAPON_SET_BONUSES
+from tests.helpers import coerce_decimal
 
 
 # ============================================================================
@@ -107,6 +108,12 @@ class TestConfigLoading:
         assert "_rarity" in meta
         assert "_class" in meta
 
+    def test_load_all_characters(self):
+        """Test bulk loading matches per-character loading"""
+        all_characters = load_all_characters()
+        assert sorted(all_characters) == sorted(list_characters())
+        assert all_characters["biscuit"] == load_character_full("biscuit")
+
     def test_load_monster_preset(self):
         """Test loading monster preset"""
         # Note: load_monster_preset needs the .json extension
@@ -123,6 +130,28 @@ class TestConfigLoading:
         assert "Formation" in result or result == {}
         # Config might be empty in test environment
 
+    def test_orjson_used_only_for_large_files(self, tmp_path, monkeypatch):
+        """Test files >= _ORJSON_MIN_BYTES go through orjson, smaller ones through json"""
+        parsed_sizes = []
+
+        def fake_orjson_loads(data):
+            parsed_sizes.append(len(data))
+            return json.loads(data)
+
+        monkeypatch.setattr(config_loader, "orjson", SimpleNamespace(loads=fake_orjson_loads))
+
+        small = tmp_path / "small.json"
+        small.write_text(json.dumps({"ATK_CHAR": 4000}), encoding="utf-8")
+        assert load_json(small) == {"ATK_CHAR": 4000}
+        assert parsed_sizes == []
+
+        large_data = {f"KEY_{i}": i for i in range(config_loader._ORJSON_MIN_BYTES // 8)}
+        large = tmp_path / "large.json"
+        large.write_text(json.dumps(large_data), encoding="utf-8")
+        assert large.stat().st_size >= config_loader._ORJSON_MIN_BYTES
+        assert load_json(large) == large_data
+        assert parsed_sizes == [large.stat().st_size]
+
     def test_get_decimal(self):
         """Test get_decimal helper"""
         config = {"value": Decimal("100.5")}
@@ -267,6 +296,28 @@ class TestWeaponSets:
         result = apply_weapon_set(config)
         assert result["DMG_AMP_BUFF"] == Decimal("40")  # 10 + 30
 
+    def test_weapon_set_does_not_mutate_input(self):
+        """Test apply_weapon_set returns a new dict and leaves input untouched"""
+        config = {"Weapon_Set": 1, "WEAK_DMG": Decimal("30")}
+        result = apply_weapon_set(config)
+        assert result is not config
+        assert config["WEAK_DMG"] == Decimal("30")
+        assert result["WEAK_DMG"] == Decimal("65")
+
+    def test_all_weapon_sets_match_bonus_table(self, weapon_set_bonuses):
+        """Test every Weapon_Set applies exactly the documented bonus"""
+        for weapon_set, expected in weapon_set_bonuses.items():
+            config = {
+                "Weapon_Set": weapon_set,
+                "WEAK_DMG": Decimal("0"),
+                "Ignore_DEF": Decimal("0"),
+                "DMG_AMP_BUFF": Decimal("0"),
+            }
+            result = apply_weapon_set(config)
+            assert result["WEAK_DMG"] == expected["weak_dmg"], expected["name"]
+            assert result["Ignore_DEF"] == expected["ignore_def"], expected["name"]
+            assert result["DMG_AMP_BUFF"] == expected["dmg_amp"], expected["name"]
+
 
 # ============================================================================
 # Standard Character Tests
@@ -275,43 +326,43 @@ class TestWeaponSets:
 class TestStandardCharacters:
     """Test standard (non-special) character calculations"""
 
-    def test_miho_standard_calculation(self):
+    def test_miho_standard_calculation(self, character_data):
         """Test Miho - standard character"""
-        meta, config = load_character_full("miho")
+        meta, config = character_data["miho"]
         assert meta is not None
         assert meta["_character"] == "Miho"
         # Skills are in the metadata (_skills)
         assert "_skills" in meta or len(config) > 0
 
-    def test_pascal_bonus_crit_dmg_mapping(self):
+    def test_pascal_bonus_crit_dmg_mapping(self, character_data):
         """Test Pascal - Bonus Crit DMG mapping"""
-        meta, config = load_character_full("pascal")
+        meta, config = character_data["pascal"]
         assert meta is not None
         # Pascal has passive crit damage bonus (not Bonus_Crit_DMG field)
         # The CRIT_DMG comes from passive, not a mapping
         assert "CRIT_DMG" in config or len(config) > 0
 
-    def test_rachel_def_reduce_dmg_amp(self):
+    def test_rachel_def_reduce_dmg_amp(self, character_data):
         """Test Rachel - DEF_REDUCE and DMG_AMP_DEBUFF"""
-        meta, config = load_character_full("rachel")
+        meta, config = character_data["rachel"]
         assert meta is not None
         # Rachel has DEF_REDUCE and DMG_AMP_DEBUFF skills
 
-    def test_teo_standard_calculation(self):
+    def test_teo_standard_calculation(self, character_data):
         """Test Teo - standard character"""
-        meta, config = load_character_full("teo")
+        meta, config = character_data["teo"]
         assert meta is not None
         assert meta["_character"] == "Teo"
 
-    def test_yeonhee_hp_based(self):
+    def test_yeonhee_hp_based(self, character_data):
         """Test Yeonhee - HP-based damage"""
-        meta, config = load_character_full("yeonhee")
+        meta, config = character_data["yeonhee"]
         assert meta is not None
         # Yeonhee has HP-based damage
 
-    def test_klahan_hp_condition(self):
+    def test_klahan_hp_condition(self, character_data):
         """Test Klahan - HP condition bonus"""
-        meta, config = load_character_full("klahan")
+        meta, config = character_data["klahan"]
         assert meta is not None
         # Has HP_Above_50_Bonus and HP_Below_50_Bonus
 
@@ -358,10 +409,10 @@ class TestCharacterRegistry:
 class TestFullCalculationIntegration:
     """Test complete calculation from config to damage"""
 
-    def test_standard_character_full_pipeline(self):
+    def test_standard_character_full_pipeline(self, character_data):
         """Test full pipeline for standard character"""
         # Load character
-        meta, char_config = load_character_full("miho")
+        meta, char_config = character_data["miho"]
         user_config = {
             "Weapon_Set": 0,
             "Formation": Decimal("42"),
@@ -381,21 +432,10 @@ class TestFullCalculationIntegration:
             "WEAK_DMG": Decimal("0"),
         }
 
-        # Apply weapon set
-        applied = apply_weapon_set(user_config)
-
-        # Convert float values back to Decimal for calculations
-        for key in applied:
-            if isinstance(applied[key], float):
-                applied[key] = Decimal(str(applied[key]))
-
-        # Merge configs
-        merged = merge_configs(char_config, applied)
-
-        # Convert merged values to Decimal as well (merge_configs returns floats)
-        for key in merged:
-            if isinstance(merged[key], float):
-                merged[key] = Decimal(str(merged[key]))
+        # Apply weapon set, merge configs, convert floats back to Decimal
+        merged = coerce_decimal(
+            merge_configs(char_config, coerce_decimal(apply_weapon_set(user_config)))
+        )
 
         # Use default skill damage for test
         skill_dmg = Decimal("100")
@@ -453,22 +493,18 @@ class TestFullCalculationIntegration:
             "DMG_Reduction": Decimal("0"),
         }
 
-        # No weapon
-        config1 = apply_weapon_set(base_config.copy())
-        raw1 = calculate_raw_dmg(
-            Decimal("6000"), Decimal("100"), Decimal(str(config1.get("CRIT_DMG", 288))),
-            Decimal(str(config1.get("WEAK_DMG", 0))), Decimal(str(config1.get("DMG_AMP_BUFF", 0))), Decimal("0"), Decimal(str(config1.get("DMG_Reduction", 0)))
-        )
-
-        # Weakness weapon
-        base_config["Weapon_Set"] = 1
-        config2 = apply_weapon_set(base_config.copy())
-        raw2 = calculate_raw_dmg(
-            Decimal("6000"), Decimal("100"), Decimal(str(config2.get("CRIT_DMG", 288))),
-            Decimal(str(config2.get("WEAK_DMG", 0))), Decimal(str(config2.get("DMG_AMP_BUFF", 0))), Decimal("0"), Decimal(str(config2.get("DMG_Reduction", 0)))
-        )
-
-        assert raw2 > raw1  # Weakness weapon increases damage
+        # Sweep every weapon set (0 = no weapon)
+        raws = []
+        for weapon_set in [0, *WEAPON_SET_BONUSES]:
+            config = apply_weapon_set({**base_config, "Weapon_Set": weapon_set})
+            raws.append(calculate_raw_dmg(
+                Decimal("6000"), Decimal("100"), Decimal(str(config.get("CRIT_DMG", 288))),
+                Decimal(str(config.get("WEAK_DMG", 0))), Decimal(str(config.get("DMG_AMP_BUFF", 0))), Decimal("0"), Decimal(str(config.get("DMG_Reduction", 0)))
+            ))
+
+        no_weapon = raws[0]
+        assert all(raw >= no_weapon for raw in raws[1:])  # No weapon set lowers RAW damage
+        assert raws[1] > no_weapon  # Weakness weapon increases damage
 
     def test_monster_preset_loading(self):
         """Test loading and using monster presets"""
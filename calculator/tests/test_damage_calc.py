@@ -5,7 +5,9 @@ Tests all functions in damage_calc.py with comprehensive coverage
 
 import pytest
 from decimal import Decimal
+from types import MappingProxyType
 
+from constants import ATK_BASE
 from damage_calc import (
     to_decimal,
     calculate_total_atk,
@@ -13,41 +15,48 @@ from damage_calc import (
     calculate_cap_atk,
     calculate_final_dmg_hp,
     calculate_raw_dmg,
+    calculate_raw_dmg_batch,
     calculate_effective_def,
     calculate_final_dmg,
+    calculate_final_dmg_batch,
 )
+from tests.helpers import ZERO, HUNDRED, approx_decimal
+
+
+# Final_DMG_HP 1000 with CRIT 288%, WEAK 65%, DMG_Reduction 10%
+EXPECTED_HP_BONUS = Decimal("1000") * Decimal("2.88") * Decimal("1.65") * Decimal("0.9")
 
 
 # ============================================================================
 # Fixtures
 # ============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def standard_config():
-    """Standard configuration for testing"""
-    return {
+    """Standard configuration for testing (read-only, shared across the module)"""
+    return MappingProxyType({
         "atk_char": Decimal("5000"),
         "atk_pet": Decimal("400"),
         "atk_base": Decimal("1500"),
         "formation": Decimal("42"),
-        "potential_pet": Decimal("0"),
-        "buff_atk": Decimal("0"),
-        "buff_atk_pet": Decimal("0"),
-    }
+        "potential_pet": ZERO,
+        "buff_atk": ZERO,
+        "buff_atk_pet": ZERO,
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def crit_weak_config():
-    """Configuration with crit and weakness modifiers"""
-    return {
+    """Configuration with crit and weakness modifiers (read-only, shared across the module)"""
+    return MappingProxyType({
         "total_atk": Decimal("5400"),
         "skill_dmg": Decimal("160"),
         "crit_dmg": Decimal("288"),
         "weak_dmg": Decimal("65"),  # 30% base + 35% weapon
-        "dmg_amp_buff": Decimal("0"),
-        "dmg_amp_debuff": Decimal("0"),
+        "dmg_amp_buff": ZERO,
+        "dmg_amp_debuff": ZERO,
         "dmg_reduction": Decimal("10"),
-    }
+    })
 
 
 # ============================================================================
@@ -105,12 +114,12 @@ class TestCalculateTotalAtk:
     def test_formation_bonus(self):
         """Test formation bonus increases ATK"""
         no_formation = calculate_total_atk(
-            Decimal("5000"), Decimal("0"), Decimal("1500"),
-            Decimal("0"), Decimal("0"), Decimal("0"), Decimal("0")
+            Decimal("5000"), ZERO, Decimal("1500"),
+            ZERO, ZERO, ZERO, ZERO
         )
         with_formation = calculate_total_atk(
-            Decimal("5000"), Decimal("0"), Decimal("1500"),
-            Decimal("50"), Decimal("0"), Decimal("0"), Decimal("0")
+            Decimal("5000"), ZERO, Decimal("1500"),
+            Decimal("50"), ZERO, ZERO, ZERO
         )
         assert with_formation > no_formation
         # 5000 vs 5000 + 750 = 5750
@@ -119,24 +128,24 @@ class TestCalculateTotalAtk:
     def test_potential_pet(self):
         """Test pet potential increases ATK"""
         no_potential = calculate_total_atk(
-            Decimal("5000"), Decimal("0"), Decimal("1500"),
-            Decimal("42"), Decimal("0"), Decimal("0"), Decimal("0")
+            Decimal("5000"), ZERO, Decimal("1500"),
+            Decimal("42"), ZERO, ZERO, ZERO
         )
         with_potential = calculate_total_atk(
-            Decimal("5000"), Decimal("0"), Decimal("1500"),
-            Decimal("42"), Decimal("10"), Decimal("0"), Decimal("0")
+            Decimal("5000"), ZERO, Decimal("1500"),
+            Decimal("42"), Decimal("10"), ZERO, ZERO
         )
         assert with_potential > no_potential
 
     def test_buff_atk_multiplicative(self):
         """Test BUFF_ATK is multiplicative"""
         no_buff = calculate_total_atk(
-            Decimal("5000"), Decimal("0"), Decimal("1500"),
-            Decimal("42"), Decimal("0"), Decimal("0"), Decimal("0")
+            Decimal("5000"), ZERO, Decimal("1500"),
+            Decimal("42"), ZERO, ZERO, ZERO
         )
         with_buff = calculate_total_atk(
-            Decimal("5000"), Decimal("0"), Decimal("1500"),
-            Decimal("42"), Decimal("0"), Decimal("50"), Decimal("0")
+            Decimal("5000"), ZERO, Decimal("1500"),
+            Decimal("42"), ZERO, Decimal("50"), ZERO
         )
         # (5000 + 0 + 630) * 1.5 = 5630 * 1.5 = 8445
         assert with_buff == Decimal("8445")
@@ -144,28 +153,23 @@ class TestCalculateTotalAtk:
     def test_zero_values(self):
         """Test with all zero values"""
         result = calculate_total_atk(
-            Decimal("0"), Decimal("0"), Decimal("0"),
-            Decimal("0"), Decimal("0"), Decimal("0"), Decimal("0")
-        )
-        assert result == Decimal("0")
-
-    def test_atk_base_by_class(self):
-        """Test ATK_BASE values by class"""
-        # From constants.py
-        atk_bases = {
-            "magic": Decimal("1500"),
-            "attack": Decimal("1500"),
-            "support": Decimal("1095"),
-            "defense": Decimal("727"),
-            "balance": Decimal("1306"),
-        }
-
-        for class_name, atk_base in atk_bases.items():
-            result = calculate_total_atk(
-                Decimal("5000"), Decimal("0"), atk_base,
-                Decimal("42"), Decimal("0"), Decimal("0"), Decimal("0")
-            )
-            assert result > Decimal("5000")
+            ZERO, ZERO, ZERO,
+            ZERO, ZERO, ZERO, ZERO
+        )
+        assert result == ZERO
+
+    @pytest.mark.parametrize("rarity,class_name,atk_base", [
+        (rarity, class_name, atk_base)
+        for rarity in ATK_BASE
+        for class_name, atk_base in ATK_BASE[rarity].items()
+    ])
+    def test_atk_base_by_class(self, rarity, class_name, atk_base):
+        """Test ATK_BASE values of every class (from constants.py)"""
+        result = calculate_total_atk(
+            Decimal("5000"), ZERO, atk_base,
+            Decimal("42"), ZERO, ZERO, ZERO
+        )
+        assert result > Decimal("5000")
 
 
 # ============================================================================
@@ -187,9 +191,9 @@ class TestCalculateDmgHp:
         """Test zero bonus returns zero"""
         result = calculate_dmg_hp(
             hp_target=Decimal("10000"),
-            bonus_dmg_hp_target=Decimal("0")
+            bonus_dmg_hp_target=ZERO
         )
-        assert result == Decimal("0")
+        assert result == ZERO
 
     def test_large_hp_value(self):
         """Test with large HP value (boss monster)"""
@@ -207,6 +211,12 @@ class TestCalculateDmgHp:
         )
         assert result == Decimal("35")
 
+    def test_result_independent_of_call_history(self):
+        """Equal inputs with a different exponent keep their own exponent"""
+        calculate_dmg_hp(Decimal("1000"), Decimal("7"))
+        result = calculate_dmg_hp(Decimal("1000.0"), Decimal("7"))
+        assert str(result) == "70.0"
+
 
 # ============================================================================
 # calculate_cap_atk() Tests
@@ -219,7 +229,7 @@ class TestCalculateCapAtk:
         """Test 100% ATK cap"""
         result = calculate_cap_atk(
             total_atk=Decimal("5000"),
-            cap_atk_percent=Decimal("100")
+            cap_atk_percent=HUNDRED
         )
         assert result == Decimal("5000")
 
@@ -235,9 +245,9 @@ class TestCalculateCapAtk:
         """Test 0% cap"""
         result = calculate_cap_atk(
             total_atk=Decimal("5000"),
-            cap_atk_percent=Decimal("0")
+            cap_atk_percent=ZERO
         )
-        assert result == Decimal("0")
+        assert result == ZERO
 
 
 # ============================================================================
@@ -275,7 +285,7 @@ class TestCalculateFinalDmgHp:
         """Test zero cap returns zero"""
         result = calculate_final_dmg_hp(
             dmg_hp=Decimal("700"),
-            cap_atk=Decimal("0")
+            cap_atk=ZERO
         )
         # Zero cap means no capping, returns actual
         assert result == Decimal("700")
@@ -308,12 +318,12 @@ class TestCalculateRawDmg:
         """Test basic damage calculation"""
         result = calculate_raw_dmg(
             total_atk=Decimal("5000"),
-            skill_dmg=Decimal("100"),
-            crit_dmg=Decimal("100"),
-            weak_dmg=Decimal("0"),
-            dmg_amp_buff=Decimal("0"),
-            dmg_amp_debuff=Decimal("0"),
-            dmg_reduction=Decimal("0"),
+            skill_dmg=HUNDRED,
+            crit_dmg=HUNDRED,
+            weak_dmg=ZERO,
+            dmg_amp_buff=ZERO,
+            dmg_amp_debuff=ZERO,
+            dmg_reduction=ZERO,
         )
         # 5000 * 1.0 * 1.0 = 5000
         assert result == Decimal("5000")
@@ -322,12 +332,12 @@ class TestCalculateRawDmg:
         """Test crit damage multiplier"""
         result = calculate_raw_dmg(
             total_atk=Decimal("5000"),
-            skill_dmg=Decimal("100"),
+            skill_dmg=HUNDRED,
             crit_dmg=Decimal("288"),
-            weak_dmg=Decimal("0"),
-            dmg_amp_buff=Decimal("0"),
-            dmg_amp_debuff=Decimal("0"),
-            dmg_reduction=Decimal("0"),
+            weak_dmg=ZERO,
+            dmg_amp_buff=ZERO,
+            dmg_amp_debuff=ZERO,
+            dmg_reduction=ZERO,
         )
         # 5000 * 1.0 * 2.88 = 14400
         assert result == Decimal("14400")
@@ -348,7 +358,7 @@ class TestCalculateRawDmg:
             total_atk=crit_weak_config["total_atk"],
             skill_dmg=crit_weak_config["skill_dmg"],
             crit_dmg=crit_weak_config["crit_dmg"],
-            weak_dmg=Decimal("0"),
+            weak_dmg=ZERO,
             dmg_amp_buff=crit_weak_config["dmg_amp_buff"],
             dmg_amp_debuff=crit_weak_config["dmg_amp_debuff"],
             dmg_reduction=crit_weak_config["dmg_reduction"],
@@ -372,55 +382,53 @@ class TestCalculateRawDmg:
     def test_dmg_amp_buff(self):
         """Test DMG_AMP_BUFF increases damage"""
         no_buff = calculate_raw_dmg(
-            Decimal("5000"), Decimal("100"), Decimal("288"),
-            Decimal("65"), Decimal("0"), Decimal("0"), Decimal("0")
+            Decimal("5000"), HUNDRED, Decimal("288"),
+            Decimal("65"), ZERO, ZERO, ZERO
         )
         with_buff = calculate_raw_dmg(
-            Decimal("5000"), Decimal("100"), Decimal("288"),
-            Decimal("65"), Decimal("70"), Decimal("0"), Decimal("0")
+            Decimal("5000"), HUNDRED, Decimal("288"),
+            Decimal("65"), Decimal("70"), ZERO, ZERO
         )
         assert with_buff > no_buff
 
     def test_dmg_reduction_decreases(self):
         """Test DMG_Reduction decreases damage"""
         no_reduction = calculate_raw_dmg(
-            Decimal("5000"), Decimal("100"), Decimal("288"),
-            Decimal("65"), Decimal("0"), Decimal("0"), Decimal("0")
+            Decimal("5000"), HUNDRED, Decimal("288"),
+            Decimal("65"), ZERO, ZERO, ZERO
         )
         with_reduction = calculate_raw_dmg(
-            Decimal("5000"), Decimal("100"), Decimal("288"),
-            Decimal("65"), Decimal("0"), Decimal("0"), Decimal("10")
+            Decimal("5000"), HUNDRED, Decimal("288"),
+            Decimal("65"), ZERO, ZERO, Decimal("10")
         )
         assert with_reduction < no_reduction
 
     def test_hp_based_damage_addition(self):
         """Test HP-based damage is added to base"""
         no_hp = calculate_raw_dmg(
-            Decimal("5000"), Decimal("100"), Decimal("288"),
-            Decimal("65"), Decimal("0"), Decimal("0"), Decimal("10"),
-            Decimal("0")
+            Decimal("5000"), HUNDRED, Decimal("288"),
+            Decimal("65"), ZERO, ZERO, Decimal("10"),
+            ZERO
         )
         with_hp = calculate_raw_dmg(
-            Decimal("5000"), Decimal("100"), Decimal("288"),
-            Decimal("65"), Decimal("0"), Decimal("0"), Decimal("10"),
+            Decimal("5000"), HUNDRED, Decimal("288"),
+            Decimal("65"), ZERO, ZERO, Decimal("10"),
             Decimal("1000")  # Final_DMG_HP
         )
         assert with_hp > no_hp
         # Difference should be HP damage with multipliers
         difference = with_hp - no_hp
-        expected_hp = Decimal("1000") * Decimal("2.88") * Decimal("1.65") * Decimal("0.9")
-        assert abs(difference - expected_hp) < Decimal("1")
+        assert difference == approx_decimal(EXPECTED_HP_BONUS)
 
     def test_zero_skill_dmg(self):
         """Test zero skill damage"""
         result = calculate_raw_dmg(
-            Decimal("5000"), Decimal("0"), Decimal("288"),
-            Decimal("65"), Decimal("0"), Decimal("0"), Decimal("10"),
+            Decimal("5000"), ZERO, Decimal("288"),
+            Decimal("65"), ZERO, ZERO, Decimal("10"),
             Decimal("1000")
         )
         # Only HP damage should remain
-        expected = Decimal("1000") * Decimal("2.88") * Decimal("1.65") * Decimal("0.9")
-        assert abs(result - expected) < Decimal("1")
+        assert result == approx_decimal(EXPECTED_HP_BONUS)
 
     def test_all_multipliers_combined(self):
         """Test all damage modifiers combined"""
@@ -432,12 +440,81 @@ class TestCalculateRawDmg:
             dmg_amp_buff=Decimal("70"),
             dmg_amp_debuff=Decimal("24"),
             dmg_reduction=Decimal("10"),
-            final_dmg_hp=Decimal("0")
+            final_dmg_hp=ZERO
         )
-        assert result > Decimal("0")
+        assert result > ZERO
         # Sanity check: should be very high
         assert result > Decimal("20000")
 
+    def test_exact_value_with_decimal_inputs(self):
+        """
+        Regression: multipliers are applied left to right, one at a time.
+
+        Regrouping them (e.g. (ATK*SKILL + HP*100) * product / 100^5) rounds
+        differently at the 28th digit and ends in ...535 instead of ...536.
+        """
+        result = calculate_raw_dmg(
+            total_atk=Decimal("3224.974"),
+            skill_dmg=Decimal("186.7291"),
+            crit_dmg=Decimal("163.97108"),
+            weak_dmg=Decimal("7.257"),
+            dmg_amp_buff=Decimal("21.226"),
+            dmg_amp_debuff=Decimal("24.8056"),
+            dmg_reduction=Decimal("2.476"),
+            final_dmg_hp=Decimal("669.71689")
+        )
+        assert result == Decimal("17452.41437855891828340626536")
+
+    def test_exact_value_without_modifiers(self):
+        """Regression: the zero-modifier shortcut keeps the same multiplication order"""
+        result = calculate_raw_dmg(
+            total_atk=Decimal("2783.5817231"),
+            skill_dmg=Decimal("97.6143771"),
+            crit_dmg=Decimal("314.2573348"),
+            weak_dmg=ZERO,
+            dmg_amp_buff=ZERO,
+            dmg_amp_debuff=ZERO,
+            dmg_reduction=ZERO,
+            final_dmg_hp=Decimal("2503.6844448")
+        )
+        assert result == Decimal("16406.93676198398752558349722")
+
+
+# ============================================================================
+# calculate_raw_dmg_batch() Tests
+# ============================================================================
+
+class TestCalculateRawDmgBatch:
+    """Test batched RAW damage calculation"""
+
+    def test_matches_scalar_calculation(self):
+        """Each case should equal a separate calculate_raw_dmg() call"""
+        cases = [
+            (Decimal("288"), ZERO),
+            (Decimal("288"), Decimal("65")),
+            (HUNDRED, ZERO),
+            (HUNDRED, Decimal("65")),
+        ]
+        results = calculate_raw_dmg_batch(
+            Decimal("5400"), Decimal("160"), cases,
+            Decimal("70"), Decimal("24"), Decimal("10"), Decimal("1000")
+        )
+        assert len(results) == len(cases)
+        for (crit_dmg, weak_dmg), result in zip(cases, results):
+            expected = calculate_raw_dmg(
+                Decimal("5400"), Decimal("160"), crit_dmg, weak_dmg,
+                Decimal("70"), Decimal("24"), Decimal("10"), Decimal("1000")
+            )
+            assert result == expected
+
+    def test_empty_cases(self):
+        """No cases returns empty list"""
+        results = calculate_raw_dmg_batch(
+            Decimal("5000"), HUNDRED, [],
+            ZERO, ZERO, ZERO
+        )
+        assert results == []
+
 
 # ============================================================================
 # calculate_effective_def() Tests
@@ -450,41 +527,49 @@ class TestCalculateEffectiveDef:
         """Test effective DEF is always greater than 1"""
         result = calculate_effective_def(
             def_target=Decimal("1461"),
-            def_buff=Decimal("0"),
-            def_reduce=Decimal("0"),
-            ignore_def=Decimal("0")
+            def_buff=ZERO,
+            def_reduce=ZERO,
+            ignore_def=ZERO
         )
         assert result > Decimal("1")
         # 1 + 0.00214135 * 1461 ≈ 4.13
         assert abs(result - Decimal("4.13")) < Decimal("1")
 
+    def test_exact_def_modifier_precision(self):
+        """DEF_Modifier (8 decimal places) must not be truncated"""
+        result = calculate_effective_def(
+            Decimal("1461"), ZERO, ZERO, ZERO
+        )
+        # 1 + 0.00214135 * 1461 = 4.12851235 (exact)
+        assert result == Decimal("4.12851235")
+
     def test_def_buff_increases(self):
         """Test DEF_BUFF increases effective DEF"""
         no_buff = calculate_effective_def(
-            Decimal("1461"), Decimal("0"), Decimal("0"), Decimal("0")
+            Decimal("1461"), ZERO, ZERO, ZERO
         )
         with_buff = calculate_effective_def(
-            Decimal("1461"), Decimal("50"), Decimal("0"), Decimal("0")
+            Decimal("1461"), Decimal("50"), ZERO, ZERO
         )
         assert with_buff > no_buff
 
     def test_def_reduce_decreases(self):
         """Test DEF_REDUCE decreases effective DEF"""
         no_reduce = calculate_effective_def(
-            Decimal("1461"), Decimal("0"), Decimal("0"), Decimal("0")
+            Decimal("1461"), ZERO, ZERO, ZERO
         )
         with_reduce = calculate_effective_def(
-            Decimal("1461"), Decimal("0"), Decimal("24"), Decimal("0")
+            Decimal("1461"), ZERO, Decimal("24"), ZERO
         )
         assert with_reduce < no_reduce
 
     def test_ignore_def_decreases(self):
         """Test Ignore_DEF decreases effective DEF"""
         no_ignore = calculate_effective_def(
-            Decimal("1461"), Decimal("0"), Decimal("0"), Decimal("0")
+            Decimal("1461"), ZERO, ZERO, ZERO
         )
         with_ignore = calculate_effective_def(
-            Decimal("1461"), Decimal("0"), Decimal("0"), Decimal("40")
+            Decimal("1461"), ZERO, ZERO, Decimal("40")
         )
         assert with_ignore < no_ignore
 
@@ -492,13 +577,13 @@ class TestCalculateEffectiveDef:
         """Test all DEF modifiers combined"""
         result = calculate_effective_def(
             def_target=Decimal("1461"),
-            def_buff=Decimal("0"),
+            def_buff=ZERO,
             def_reduce=Decimal("24"),
             ignore_def=Decimal("40")
         )
         # Should be lower than base DEF
         base = calculate_effective_def(
-            Decimal("1461"), Decimal("0"), Decimal("0"), Decimal("0")
+            Decimal("1461"), ZERO, ZERO, ZERO
         )
         assert result < base
         # But still greater than 1
@@ -507,10 +592,10 @@ class TestCalculateEffectiveDef:
     def test_zero_def_target(self):
         """Test zero DEF target"""
         result = calculate_effective_def(
-            def_target=Decimal("0"),
-            def_buff=Decimal("0"),
-            def_reduce=Decimal("0"),
-            ignore_def=Decimal("0")
+            def_target=ZERO,
+            def_buff=ZERO,
+            def_reduce=ZERO,
+            ignore_def=ZERO
         )
         assert result == Decimal("1")
 
@@ -518,11 +603,11 @@ class TestCalculateEffectiveDef:
         """Test Castle Room DEF values"""
         # Room 1: DEF = 689
         room1 = calculate_effective_def(
-            Decimal("689"), Decimal("0"), Decimal("0"), Decimal("0")
+            Decimal("689"), ZERO, ZERO, ZERO
         )
         # Room 2: DEF = 784
         room2 = calculate_effective_def(
-            Decimal("784"), Decimal("0"), Decimal("0"), Decimal("0")
+            Decimal("784"), ZERO, ZERO, ZERO
         )
         assert room2 > room1
         assert room1 > Decimal("1")
@@ -572,7 +657,7 @@ class TestCalculateFinalDmg:
     def test_zero_damage(self):
         """Test zero raw damage"""
         result = calculate_final_dmg(
-            raw_dmg=Decimal("0"),
+            raw_dmg=ZERO,
             effective_def=Decimal("2")
         )
         assert result == 0
@@ -605,6 +690,22 @@ class TestCalculateFinalDmg:
         assert result == 5000
 
 
+class TestCalculateFinalDmgBatch:
+    """Test batched Final Damage calculation"""
+
+    def test_matches_scalar_calculation(self):
+        """Each value should equal a separate calculate_final_dmg() call"""
+        raw_dmgs = [Decimal("5000"), Decimal("1001"), ZERO, Decimal("100000000")]
+        effective_def = Decimal("4.12851235")
+        results = calculate_final_dmg_batch(raw_dmgs, effective_def)
+        assert results == [calculate_final_dmg(raw, effective_def) for raw in raw_dmgs]
+        assert all(isinstance(result, int) for result in results)
+
+    def test_empty_input(self):
+        """No RAW values returns empty list"""
+        assert calculate_final_dmg_batch([], Decimal("2")) == []
+
+
 # ============================================================================
 # Integration Tests
 # ============================================================================
@@ -617,23 +718,23 @@ class TestFullDamagePipeline:
         # Calculate Total ATK
         total_atk = calculate_total_atk(
             Decimal("4488"), Decimal("391"), Decimal("1500"),
-            Decimal("42"), Decimal("0"), Decimal("0"), Decimal("19")
+            Decimal("42"), ZERO, ZERO, Decimal("19")
         )
 
         # Calculate RAW Damage
         raw_dmg = calculate_raw_dmg(
             total_atk=total_atk,
-            skill_dmg=Decimal("100"),
+            skill_dmg=HUNDRED,
             crit_dmg=Decimal("288"),
             weak_dmg=Decimal("65"),
-            dmg_amp_buff=Decimal("0"),
-            dmg_amp_debuff=Decimal("0"),
-            dmg_reduction=Decimal("0"),
+            dmg_amp_buff=ZERO,
+            dmg_amp_debuff=ZERO,
+            dmg_reduction=ZERO,
         )
 
         # Calculate Effective DEF
         eff_def = calculate_effective_def(
-            Decimal("1461"), Decimal("0"), Decimal("0"), Decimal("0")
+            Decimal("1461"), ZERO, ZERO, ZERO
         )
 
         # Calculate Final Damage
@@ -655,14 +756,14 @@ class TestFullDamagePipeline:
             skill_dmg=Decimal("160"),
             crit_dmg=Decimal("288"),
             weak_dmg=Decimal("65"),
-            dmg_amp_buff=Decimal("0"),
-            dmg_amp_debuff=Decimal("0"),
+            dmg_amp_buff=ZERO,
+            dmg_amp_debuff=ZERO,
             dmg_reduction=Decimal("10"),
         )
 
         eff_def = calculate_effective_def(
             def_target=Decimal("1461"),
-            def_buff=Decimal("0"),
+            def_buff=ZERO,
             def_reduce=Decimal("24"),
             ignore_def=Decimal("40")
         )
@@ -683,13 +784,13 @@ class TestInvariants:
     def test_damage_never_negative(self):
         """Damage should never be negative"""
         total_atk = calculate_total_atk(
-            Decimal("100"), Decimal("0"), Decimal("100"),
-            Decimal("10"), Decimal("0"), Decimal("0"), Decimal("0")
+            Decimal("100"), ZERO, Decimal("100"),
+            Decimal("10"), ZERO, ZERO, ZERO
         )
 
         raw_dmg = calculate_raw_dmg(
-            total_atk, Decimal("100"), Decimal("100"),
-            Decimal("0"), Decimal("0"), Decimal("0"), Decimal("0")
+            total_atk, HUNDRED, HUNDRED,
+            ZERO, ZERO, ZERO, ZERO
         )
 
         final = calculate_final_dmg(raw_dmg, Decimal("2"))
@@ -697,22 +798,22 @@ class TestInvariants:
 
     def test_effective_def_always_greater_than_one(self):
         """Effective DEF should always be >= 1"""
-        for def_target in [Decimal("0"), Decimal("100"), Decimal("1000"), Decimal("5000")]:
+        for def_target in [ZERO, Decimal("100"), Decimal("1000"), Decimal("5000")]:
             result = calculate_effective_def(
-                def_target, Decimal("0"), Decimal("0"), Decimal("0")
+                def_target, ZERO, ZERO, ZERO
             )
             assert result >= Decimal("1")
 
     def test_buff_increases_damage(self):
         """BUFF_ATK should always increase total ATK"""
         base = calculate_total_atk(
-            Decimal("5000"), Decimal("0"), Decimal("1500"),
-            Decimal("42"), Decimal("0"), Decimal("0"), Decimal("0")
+            Decimal("5000"), ZERO, Decimal("1500"),
+            Decimal("42"), ZERO, ZERO, ZERO
         )
 
         buffed = calculate_total_atk(
-            Decimal("5000"), Decimal("0"), Decimal("1500"),
-            Decimal("42"), Decimal("0"), Decimal("50"), Decimal("0")
+            Decimal("5000"), ZERO, Decimal("1500"),
+            Decimal("42"), ZERO, Decimal("50"), ZERO
         )
 
         assert buffed > base
@@ -720,13 +821,13 @@ class TestInvariants:
     def test_reduction_decreases_damage(self):
         """DMG_Reduction should always decrease damage"""
         no_reduction = calculate_raw_dmg(
-            Decimal("5000"), Decimal("100"), Decimal("288"),
-            Decimal("0"), Decimal("0"), Decimal("0"), Decimal("0")
+            Decimal("5000"), HUNDRED, Decimal("288"),
+            ZERO, ZERO, ZERO, ZERO
         )
 
         with_reduction = calculate_raw_dmg(
-            Decimal("5000"), Decimal("100"), Decimal("288"),
-            Decimal("0"), Decimal("0"), Decimal("0"), Decimal("10")
+            Decimal("5000"), HUNDRED, Decimal("288"),
+            ZERO, ZERO, ZERO, Decimal("10")
         )
 
         assert with_reduction < no_reduction
@@ -0,0 +1,34 @@
+"""
+Unit Tests for Shared Test Helpers
+Tests the comparison and conversion helpers in tests/helpers.py
+"""
+
+from decimal import Decimal
+
+from tests.helpers import approx_decimal, coerce_decimal
+
+
+class TestApproxDecimal:
+    """Test approx_decimal tolerance comparison"""
+
+    def test_within_tolerance(self):
+        """Values within tolerance compare equal"""
+        assert Decimal("4.12851235") == approx_decimal(Decimal("4.13"), Decimal("0.01"))
+
+    def test_outside_tolerance(self):
+        """Values outside tolerance compare unequal"""
+        assert Decimal("4.12851235") != approx_decimal(Decimal("4.2"), Decimal("0.01"))
+
+    def test_non_numeric_is_unequal(self):
+        """Non-numeric values are unequal instead of raising"""
+        assert None != approx_decimal(Decimal("4.13"))  # noqa: E711
+        assert "n/a" != approx_decimal(Decimal("4.13"))
+
+
+class TestCoerceDecimal:
+    """Test coerce_decimal float conversion"""
+
+    def test_converts_only_floats(self):
+        """Floats become Decimal via str(), other values are kept"""
+        result = coerce_decimal({"CRIT_DMG": 288.5, "Formation": 42, "Name": "x"})
+        assert result == {"CRIT_DMG": Decimal("288.5"), "Formation": 42, "Name": "x"}